@@ -80,7 +80,8 @@ def plot_and_export(
             ``main_palette``, ``exclusion_palette``, ``ax``, ``verbose``,
             etc.  Passing any of ``save_dir``, ``img_name``, or
             ``basename`` raises :class:`TypeError` — use *out_dir* and
-            *name* instead.
+            *name* instead.  ``return_artists`` and ``reuse`` are not
+            supported either; call :func:`plot_cfd` directly for those.
 
     Returns:
         ``(fig, ax, export_result)`` — the same ``(Figure, Axes)``
@@ -89,7 +90,8 @@ def plot_and_export(
 
     Raises:
         TypeError: If any of ``save_dir`` / ``img_name`` / ``basename``
-            is passed via ``**kwargs`` (use *out_dir* / *name* instead).
+            is passed via ``**kwargs`` (use *out_dir* / *name* instead),
+            or if ``return_artists`` / ``reuse`` is passed.
         ValueError: If exactly one of *out_dir* / *name* is provided
             (both or neither, never just one).
 
@@ -118,6 +120,14 @@ def plot_and_export(
             f"plot_and_export does not accept {sorted(conflicts)!r}; "
             "use the `out_dir` and `name` arguments instead."
         )
+    # plot_cfd would return an extra artists handle for these; reject
+    # them before anything is written rather than fail on unpacking.
+    unsupported = {"return_artists", "reuse"} & kwargs.keys()
+    if unsupported:
+        raise TypeError(
+            f"plot_and_export does not accept {sorted(unsupported)!r}; "
+            "call plot_cfd directly to reuse a drawn diagram."
+        )
 
     # 2. Reject mismatched out_dir / name.  Without this guard, a stray
     #    `out_dir="x"` (no `name`) would render the figure in memory,
@@ -0,0 +1,116 @@
+"""Array kernels for building the diagram's box outlines.
+
+All boxes of one kind are turned into vertex arrays in a single call
+instead of one :class:`~matplotlib.patches.FancyBboxPatch` per box, and
+the resulting paths are drawn as one collection.  The kernels are
+written as plain loops so that `Numba <https://numba.pydata.org>`_ can
+compile them when it is installed (``pip install pycohortflow[fast]``);
+without it they run as ordinary Python, which is fast enough for the
+handful of boxes in a typical diagram.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from matplotlib.path import Path
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - exercised when numba is absent
+
+    def njit(*args, **kwargs):
+        """Stand-in for :func:`numba.njit` that returns the function as is."""
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ["box_paths"]
+
+# Codes of a closed rectangle, matching ``Path.unit_rectangle()``.
+_RECT_CODES = np.array(
+    [Path.MOVETO, Path.LINETO, Path.LINETO, Path.LINETO, Path.CLOSEPOLY], dtype=Path.code_type
+)
+
+# Codes of a rounded rectangle, matching Matplotlib's ``BoxStyle.Round``:
+# straight edges joined by one quadratic Bézier per corner.
+_ROUND_CODES = np.array(
+    [Path.MOVETO, Path.LINETO]
+    + [Path.CURVE3, Path.CURVE3, Path.LINETO] * 3
+    + [Path.CURVE3, Path.CURVE3, Path.CLOSEPOLY],
+    dtype=Path.code_type,
+)
+
+
+@njit(cache=True)
+def _rect_vertices(x0, y0, x1, y1):
+    n = x0.shape[0]
+    out = np.empty((n, 5, 2))
+    for i in range(n):
+        out[i, 0, 0], out[i, 0, 1] = x0[i], y0[i]
+        out[i, 1, 0], out[i, 1, 1] = x1[i], y0[i]
+        out[i, 2, 0], out[i, 2, 1] = x1[i], y1[i]
+        out[i, 3, 0], out[i, 3, 1] = x0[i], y1[i]
+        out[i, 4, 0], out[i, 4, 1] = x0[i], y0[i]
+    return out
+
+
+@njit(cache=True)
+def _round_rect_vertices(x0, y0, x1, y1, dr):
+    n = x0.shape[0]
+    out = np.empty((n, 14, 2))
+    for i in range(n):
+        a, b, c, d = x0[i], y0[i], x1[i], y1[i]
+        out[i, 0, 0], out[i, 0, 1] = a + dr, b
+        out[i, 1, 0], out[i, 1, 1] = c - dr, b
+        out[i, 2, 0], out[i, 2, 1] = c, b
+        out[i, 3, 0], out[i, 3, 1] = c, b + dr
+        out[i, 4, 0], out[i, 4, 1] = c, d - dr
+        out[i, 5, 0], out[i, 5, 1] = c, d
+        out[i, 6, 0], out[i, 6, 1] = c - dr, d
+        out[i, 7, 0], out[i, 7, 1] = a + dr, d
+        out[i, 8, 0], out[i, 8, 1] = a, d
+        out[i, 9, 0], out[i, 9, 1] = a, d - dr
+        out[i, 10, 0], out[i, 10, 1] = a, b + dr
+        out[i, 11, 0], out[i, 11, 1] = a, b
+        out[i, 12, 0], out[i, 12, 1] = a + dr, b
+        out[i, 13, 0], out[i, 13, 1] = a + dr, b
+    return out
+
+
+def box_paths(x, y, width, height, pad, corner_radius):
+    """Return the outlines of several boxes as Matplotlib paths.
+
+    Each box is drawn *pad* outside the rectangle ``(x, y, width,
+    height)``.  With a positive *corner_radius* the outline is identical
+    to a :class:`~matplotlib.patches.FancyBboxPatch` using
+    ``BoxStyle("Round", pad=pad, rounding_size=corner_radius)``;
+    otherwise it is a plain rectangle.
+
+    Args:
+        x (array_like): Left edge of each box (before padding).
+        y (array_like): Top edge of each box in data coordinates (the
+            smaller y value; the diagram's y-axis is inverted).
+        width (array_like): Width of each box; broadcast against *x*.
+        height (array_like): Height of each box; broadcast against *x*.
+        pad (float): Padding around each box in data units.
+        corner_radius (float): Corner rounding in data units.
+
+    Returns:
+        list[matplotlib.path.Path]: One closed path per box.
+
+    """
+    x, y, width, height = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (x, y, width, height))
+    )
+    x0 = np.ascontiguousarray(x - pad)
+    y0 = np.ascontiguousarray(y - pad)
+    x1 = x0 + (width + 2 * pad)
+    y1 = y0 + (height + 2 * pad)
+    if corner_radius > 0:
+        verts, codes = _round_rect_vertices(x0, y0, x1, y1, float(corner_radius)), _ROUND_CODES
+    else:
+        verts, codes = _rect_vertices(x0, y0, x1, y1), _RECT_CODES
+    return [Path(v, codes) for v in verts]
@@ -5,19 +5,184 @@ which renders a vertical flow chart from a simple Python list of cohort
 steps.
 """
 
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import matplotlib as mpl
+import matplotlib.colors as mcolors
 import matplotlib.patches as patches
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection, PatchCollection, PathCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path
 
+from pycohortflow._fast import box_paths
 from pycohortflow.cfd_util import (
+    _gradient_rgba,
+    _wrap_cached,
     apply_kwarg_overrides,
-    gradient_palette,
     load_style_config,
     resolve_color,
     save_figure,
-    wrap_lines,
 )
 
-__all__ = ["plot_cfd"]
+__all__ = ["plot_cfd", "CohortFlowArtists"]
+
+
+@dataclass
+class CohortFlowArtists:
+    """Handles to the artists of a diagram drawn by :func:`plot_cfd`.
+
+    Returned by ``plot_cfd(..., return_artists=True)`` and accepted back
+    through ``plot_cfd(..., reuse=artists)``, which re-colours and
+    re-labels the existing boxes in place instead of rebuilding the
+    figure.  Treat the fields as read-only.
+
+    Attributes:
+        fig: The figure the diagram lives in.
+        ax: The axes the diagram is drawn on.
+        layout: Geometry signature of the diagram; reuse requires the
+            new data to produce the same one.
+        main_boxes: Collection holding every main box.
+        exclusion_boxes: Collection holding the exclusion boxes, or
+            ``None`` when the diagram has none.
+        exclusion_box_nodes: Node index of each exclusion box.
+        title_texts: Heading text artist of each node.
+        body_texts: Body text artist of each node.
+        exclusion_texts: Exclusion label artist keyed by node index.
+        background: Cached pixels of the static layer (arrows, title,
+            axes background) used for blitting; captured on first reuse.
+
+    """
+
+    fig: Any
+    ax: Any
+    layout: tuple
+    main_boxes: Any
+    exclusion_boxes: Any
+    exclusion_box_nodes: list[int]
+    title_texts: list[Any]
+    body_texts: list[Any]
+    exclusion_texts: dict[int, Any]
+    background: Any = field(default=None, repr=False)
+    _background_size: Any = field(default=None, repr=False)
+
+    def dynamic_artists(self):
+        """Return the artists that :func:`plot_cfd` updates on reuse."""
+        artists = [self.main_boxes]
+        if self.exclusion_boxes is not None:
+            artists.append(self.exclusion_boxes)
+        artists.extend(self.title_texts)
+        artists.extend(self.body_texts)
+        artists.extend(self.exclusion_texts.values())
+        return artists
+
+
+def _blit(artists):
+    """Redraw only the dynamic artists of a reused diagram.
+
+    The static layer is rendered once with the dynamic artists hidden
+    and cached via ``copy_from_bbox``; later refreshes restore it and
+    draw just the boxes and texts on top.  Canvases that cannot blit
+    fall back to a deferred full redraw.
+    """
+    fig, ax = artists.fig, artists.ax
+    canvas = fig.canvas
+    if not getattr(canvas, "supports_blit", False):
+        canvas.draw_idle()
+        return
+
+    dynamic = artists.dynamic_artists()
+    size = tuple(fig.bbox.size)
+    if artists.background is None or artists._background_size != size:
+        for artist in dynamic:
+            artist.set_visible(False)
+        canvas.draw()
+        artists.background = canvas.copy_from_bbox(ax.bbox)
+        artists._background_size = size
+        for artist in dynamic:
+            artist.set_visible(True)
+
+    canvas.restore_region(artists.background)
+    for artist in dynamic:
+        ax.draw_artist(artist)
+    canvas.blit(ax.bbox)
+
+
+def _palette_rgba(palette, start, end, n, allow_named_colors):
+    """Return the default colours of *n* boxes as an ``(n, 4)`` RGBA array.
+
+    Args:
+        palette (list | None): Explicit per-node colours (the
+            ``main_palette`` / ``exclusion_palette`` kwargs).  Each entry
+            is validated with :func:`resolve_color`.
+        start (str): Gradient start colour, used when *palette* is empty.
+        end (str): Gradient end colour.
+        n (int): Number of boxes.
+        allow_named_colors (bool): Passed to :func:`resolve_color`.
+
+    Returns:
+        numpy.ndarray: A writable ``(n, 4)`` float array.
+
+    """
+    if palette:
+        return mcolors.to_rgba_array(
+            [resolve_color(palette[i], palette[i], allow_named_colors) for i in range(n)]
+        )
+    return _gradient_rgba(start, end, n)
+
+
+def _arrowhead(direction, mutation_scale, linewidth, filled):
+    """Return an arrowhead outline in points, pointing at the origin.
+
+    Mirrors Matplotlib's ``"->"`` (open) and ``"-|>"`` (filled) arrow
+    styles, whose heads are ``0.4`` long and ``0.2`` wide (per side) in
+    units of *mutation_scale*.  Like those styles, the outline is set
+    back from the origin so that its stroked tip, not the path itself,
+    ends there; the shaft should stop the same distance short.
+
+    Args:
+        direction (str): ``"down"`` or ``"right"`` on screen.
+        mutation_scale (float): Arrow size in points.
+        linewidth (float): Stroke width of the head in points.
+        filled (bool): Close the outline into a triangle.
+
+    Returns:
+        tuple[matplotlib.path.Path, float]: The outline and the setback
+        in points.
+
+    """
+    length = 0.4 * mutation_scale
+    half_width = 0.2 * mutation_scale
+    # A mitred tip reaches past its vertex by half the line width over
+    # the sine of the head's half-angle.
+    setback = 0.5 * linewidth * np.hypot(length, half_width) / half_width
+    back = length + setback
+    if direction == "down":
+        verts = [(-half_width, back), (0.0, setback), (half_width, back)]
+    else:
+        verts = [(-back, half_width), (-setback, 0.0), (-back, -half_width)]
+    if filled:
+        return Path(verts + [verts[0]], closed=True), setback
+    return Path(verts), setback
+
+
+def _add_arrowheads(ax, tips, head, **kwargs):
+    """Stamp the arrowhead *head* at every ``(x, y)`` in *tips*.
+
+    The heads are drawn as scatter markers so they keep their size in
+    points (like ``annotate`` arrows) while all of them share a single
+    collection.  Marker paths are normalised to ``[-0.5, 0.5]`` by their
+    largest coordinate, so a marker size of twice that coordinate,
+    squared, reproduces the outline at 1:1 scale.
+    """
+    if not tips:
+        return
+    xs, ys = zip(*tips)
+    extent = np.abs(head.vertices).max()
+    ax.scatter(xs, ys, s=(2 * extent) ** 2, marker=head, **kwargs)
 
 
 def plot_cfd(
@@ -31,6 +196,8 @@ def plot_cfd(
     style_config_path=None,
     transparent=False,
     verbose=False,
+    reuse=None,
+    return_artists=False,
     **kwargs,
 ):
     """Draw a vertical cohort flow diagram.
@@ -89,6 +256,17 @@ def plot_cfd(
         verbose (bool): If ``True``, print a ``Saved: <path>`` line to
             stdout for every file written when *img_name* is provided.
             Defaults to ``False`` (silent).
+        reuse (CohortFlowArtists | None): Handles from an earlier call
+            made with ``return_artists=True``.  When given, the existing
+            diagram is updated in place: box colours, texts and heading
+            weights are replaced and only those artists are redrawn
+            (blitted where the canvas supports it).  The new *data* and
+            style must produce the same layout (node count, box sizes,
+            heading line counts and exclusion steps); *ax* and the figure-level arguments
+            are ignored apart from *img_name* and friends.
+        return_artists (bool): If ``True``, also return a
+            :class:`CohortFlowArtists` for later use with *reuse*.
+            Implied by *reuse*.
         **kwargs: Ad-hoc overrides.  Currently recognised keys:
 
             * ``dpi`` (``int``) – Figure resolution (ignored when *ax*
@@ -104,11 +282,13 @@ def plot_cfd(
         tuple[matplotlib.figure.Figure, matplotlib.axes.Axes]: The
         Matplotlib figure and axes objects so that callers can further
         customise the plot.  When *ax* is provided the returned figure
-        is ``ax.figure``.
+        is ``ax.figure``.  With *return_artists* or *reuse*, a third
+        element holds the :class:`CohortFlowArtists`.
 
     Raises:
         ValueError: If *data* is empty, a node has a higher ``N`` than
-            the preceding node, or *style* is not recognised.
+            the preceding node, *style* is not recognised, or *reuse*
+            is given but the layout has changed.
 
     Example:
         >>> from pycohortflow import plot_cfd
@@ -128,6 +308,13 @@ def plot_cfd(
         >>> plot_cfd(data, ax=axes[0], figure_title="Left")
         >>> plot_cfd(data, ax=axes[1], style="colorful")
 
+        Refreshing a diagram whose counts change but whose layout does
+        not (e.g. in a dashboard):
+
+        >>> fig, ax, artists = plot_cfd(data, return_artists=True)
+        >>> data[2]["N"] = 118
+        >>> fig, ax, artists = plot_cfd(data, reuse=artists)
+
     """
     if not data:
         raise ValueError("data must contain at least one cohort node.")
@@ -163,93 +350,114 @@ def plot_cfd(
     colors = cfg["colors"]
     exclusion_mode = cfg.get("exclusion", {}).get("mode", "box")
 
-    # Colour palettes
-    main_palette = kwargs.get("main_palette") or gradient_palette(
-        colors["main_start"], colors["main_end"], len(data)
+    # Colour palettes, as (M, 4) RGBA arrays; per-node overrides replace
+    # individual rows below.
+    allow_named = colors["allow_named_colors"]
+    main_colors = _palette_rgba(
+        kwargs.get("main_palette"), colors["main_start"], colors["main_end"], len(data), allow_named
     )
-    excl_palette = kwargs.get("exclusion_palette") or gradient_palette(
-        colors["exclusion_start"], colors["exclusion_end"], len(data)
+    excl_colors = _palette_rgba(
+        kwargs.get("exclusion_palette"),
+        colors["exclusion_start"],
+        colors["exclusion_end"],
+        len(data),
+        allow_named,
     )
 
     # ── 2. Data Processing & Sizing ────────────────────────────────────
-    processed_nodes = []
+    counts = np.array([node["N"] for node in data])
+    excl_counts = np.zeros_like(counts)
+    excl_counts[1:] = counts[:-1] - counts[1:]
+
+    increases = np.flatnonzero(excl_counts < 0)
+    if increases.size:
+        i = int(increases[0])
+        raise ValueError(f"Node {i} has more patients ({data[i]['N']}) than previous step.")
+
+    # Per-node attributes are kept as parallel sequences (struct of
+    # arrays): numeric ones as NumPy arrays, labels as ready-to-draw
+    # strings alongside their wrapped line counts.
+    title_labels = []
+    body_labels = []
+    excl_labels = []
+    title_line_counts = []
+    body_line_counts = []
+    excl_line_counts = []
+    heading_weights = []
+    default_excl = _wrap_cached("Excluded", layout["exclusion_text_width"], False)
 
     for i, node in enumerate(data):
         n_curr = node["N"]
-        n_prev = data[i - 1]["N"] if i > 0 else n_curr
-        n_excluded = n_prev - n_curr
-
-        if n_excluded < 0:
-            raise ValueError(f"Node {i} has more patients ({n_curr}) than previous step.")
+        # Labels use the caller's own numbers (not the array, which
+        # promotes every count to float as soon as one of them is).
+        n_excluded = data[i - 1]["N"] - n_curr if i > 0 else 0
 
         heading = node.get("heading", "").strip() or f"Step {i + 1}"
         desc = node.get("description", "").strip()
         excl_desc = node.get("exclusion_description", "Excluded").strip()
 
         # Wrap text
-        title_lines = wrap_lines(heading, width=layout["main_title_width"])
-        body_lines = [f"(n = {n_curr})"]
-        if desc:
-            body_lines.append("")
-            body_lines.extend(wrap_lines(desc, width=layout["main_text_width"]))
-
-        # Height calculation
-        main_h_calc = (
-            geom["padding"]
-            + geom["title_line_height"] * max(1, len(title_lines))
-            + geom["title_body_gap"]
-            + geom["body_line_height"] * max(1, len(body_lines))
-        )
-        main_h = max(geom["min_main_height"], main_h_calc)
-
-        excl_lines = wrap_lines(excl_desc, width=layout["exclusion_text_width"])
-        excl_lines.append(f"(n = {n_excluded})")
+        title = _wrap_cached(heading, layout["main_title_width"], False)
+        title_labels.append("\n".join(title))
+        title_line_counts.append(len(title))
 
-        excl_h_calc = geom["padding"] + geom["body_line_height"] * max(1, len(excl_lines))
-        excl_h = max(geom["min_exclusion_height"], excl_h_calc)
-
-        # Colour resolution
-        main_color_raw = node.get("color", main_palette[i])
-        excl_color_raw = node.get("exclusion_color", excl_palette[i])
+        # Without a description the body is just the count label.
+        count_label = f"(n = {n_curr})"
+        if desc:
+            desc_lines = _wrap_cached(desc, layout["main_text_width"], False)
+            body_labels.append(count_label + "\n\n" + "\n".join(desc_lines))
+            body_line_counts.append(len(desc_lines) + 2)
+        else:
+            body_labels.append(count_label)
+            body_line_counts.append(1)
+
+        if excl_desc == "Excluded":
+            excl = default_excl
+        else:
+            excl = _wrap_cached(excl_desc, layout["exclusion_text_width"], False)
+        excl_labels.append("\n".join((*excl, f"(n = {n_excluded})")))
+        excl_line_counts.append(len(excl) + 1)
 
         # Per-node heading weight override; falls back to the style default.
-        heading_weight = node.get("heading_fontweight", txt["heading_fontweight"])
-
-        processed_nodes.append(
-            {
-                "n": n_curr,
-                "excl_n": n_excluded,
-                "title_lines": title_lines,
-                "body_lines": body_lines,
-                "excl_lines": excl_lines,
-                "color": resolve_color(
-                    main_color_raw, main_palette[i], colors["allow_named_colors"]
-                ),
-                "excl_color": resolve_color(
-                    excl_color_raw, excl_palette[i], colors["allow_named_colors"]
-                ),
-                "main_h": main_h,
-                "excl_h": excl_h,
-                "heading_fontweight": heading_weight,
-            }
-        )
+        heading_weights.append(node.get("heading_fontweight", txt["heading_fontweight"]))
+
+    # Per-node colour overrides.  Most diagrams have none, in which case
+    # the palettes are used as-is and no colour is resolved at all.
+    if any("color" in node or "exclusion_color" in node for node in data):
+        for i, node in enumerate(data):
+            if node.get("color") is not None:
+                main_colors[i] = mcolors.to_rgba(resolve_color(node["color"], None, allow_named))
+            if node.get("exclusion_color") is not None:
+                excl_colors[i] = mcolors.to_rgba(
+                    resolve_color(node["exclusion_color"], None, allow_named)
+                )
+
+    # Box heights
+    main_h = np.maximum(
+        geom["min_main_height"],
+        geom["padding"]
+        + geom["title_line_height"] * np.maximum(1, title_line_counts)
+        + geom["title_body_gap"]
+        + geom["body_line_height"] * np.maximum(1, body_line_counts),
+    )
+    excl_h = np.maximum(
+        geom["min_exclusion_height"],
+        geom["padding"] + geom["body_line_height"] * np.maximum(1, excl_line_counts),
+    )
 
     # ── 3. Geometry Calculation ────────────────────────────────────────
-    transition_gaps = []
-    for i in range(1, len(processed_nodes)):
-        node = processed_nodes[i]
-        req_gap = node["excl_h"] + 2 * geom["clearance"] if node["excl_n"] > 0 else 0
-        transition_gaps.append(max(layout["base_gap"], req_gap))
-
-    centers_y = [layout["top_margin"] + processed_nodes[0]["main_h"] / 2]
-    for i in range(1, len(processed_nodes)):
-        prev = centers_y[-1]
-        gap = transition_gaps[i - 1]
-        curr_h = processed_nodes[i]["main_h"]
-        prev_h = processed_nodes[i - 1]["main_h"]
-        centers_y.append(prev + (prev_h / 2) + gap + (curr_h / 2))
-
-    total_height = centers_y[-1] + processed_nodes[-1]["main_h"] / 2 + layout["bottom_margin"]
+    # A transition must be tall enough to fit its exclusion box.
+    transition_gaps = np.maximum(
+        layout["base_gap"],
+        np.where(excl_counts[1:] > 0, excl_h[1:] + 2 * geom["clearance"], 0.0),
+    )
+    centers_y = (
+        layout["top_margin"]
+        + main_h[0] / 2
+        + np.concatenate(([0.0], np.cumsum((main_h[:-1] + main_h[1:]) / 2 + transition_gaps)))
+    )
+
+    total_height = centers_y[-1] + main_h[-1] / 2 + layout["bottom_margin"]
 
     # Horizontal centres
     center_x = 0.0
@@ -257,6 +465,41 @@ def plot_cfd(
         layout["main_box_width"] / 2 + layout["side_gap"] + layout["exclusion_box_width"] / 2
     )
 
+    layout_signature = (
+        exclusion_mode,
+        layout["main_box_width"],
+        layout["exclusion_box_width"],
+        excl_x,
+        tuple(centers_y.tolist()),
+        tuple(main_h.tolist()),
+        tuple(excl_h.tolist()),
+        tuple((excl_counts > 0).tolist()),
+        # Body texts sit below the (wrapped) title, so its line count
+        # fixes their position even when the box height does not change.
+        tuple(title_line_counts),
+    )
+
+    if reuse is not None:
+        if reuse.layout != layout_signature:
+            raise ValueError(
+                "reuse requires the same diagram layout (node count, box sizes, "
+                "heading line counts and exclusion steps); call plot_cfd without "
+                "reuse to redraw."
+            )
+        reuse.main_boxes.set_facecolor(main_colors)
+        if reuse.exclusion_boxes is not None:
+            reuse.exclusion_boxes.set_facecolor(excl_colors[reuse.exclusion_box_nodes])
+        for i in range(len(data)):
+            reuse.title_texts[i].set_text(title_labels[i])
+            reuse.title_texts[i].set_fontweight(heading_weights[i])
+            reuse.body_texts[i].set_text(body_labels[i])
+        for i, text in reuse.exclusion_texts.items():
+            text.set_text(excl_labels[i])
+        _blit(reuse)
+        if img_name:
+            save_figure(reuse.fig, save_dir, img_name, save_format, verbose=verbose)
+        return reuse.fig, reuse.ax, reuse
+
     # ── 4. Plotting ────────────────────────────────────────────────────
     if ax is None:
         # Create a new figure and axes
@@ -278,18 +521,30 @@ def plot_cfd(
                 max(cfg["figure"]["figsize_height"], total_height),
             )
 
+        # pyplot (and with it a backend) is only needed to create a new
+        # figure, so callers that pass ``ax`` never import it.
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(figsize=figsize, dpi=cfg["figure"]["dpi"])
     else:
         # Use the provided axes; derive the figure from it
         fig = ax.figure
 
-    # Transparent background
+    # Transparent background.  Axes handed in by a dashboard may already
+    # be set up, so only touch what still needs changing.
     if transparent:
-        fig.patch.set_alpha(0.0)
-        ax.patch.set_alpha(0.0)
-
-    ax.invert_yaxis()
-    ax.axis("off")
+        for patch in (fig.patch, ax.patch):
+            if patch.get_alpha() != 0.0:
+                patch.set_alpha(0.0)
+
+    if not ax.yaxis_inverted():
+        ax.invert_yaxis()
+    if ax.axison:
+        ax.axis("off")
+    # Limits are set explicitly at the end, so skip the data-limit
+    # bookkeeping Matplotlib would otherwise do for every added artist.
+    ax.set_autoscale_on(False)
+    ax.use_sticky_edges = False
 
     if figure_title:
         ax.set_title(
@@ -299,152 +554,226 @@ def plot_cfd(
             pad=cfg["figure"]["title_pad"],
         )
 
-    for i, node in enumerate(processed_nodes):
-        y_pos = centers_y[i]
-
-        # ── Main box ──
-        box = patches.FancyBboxPatch(
-            (center_x - layout["main_box_width"] / 2, y_pos - node["main_h"] / 2),
-            layout["main_box_width"],
-            node["main_h"],
-            boxstyle=(f"round,pad={geom['pad_factor']},rounding_size={geom['corner_radius']}"),
-            edgecolor="black",
-            facecolor=node["color"],
-            linewidth=lines["box_linewidth"],
-            zorder=2,
+    # ── Set axis limits ──
+    left_lim = center_x - layout["main_box_width"] / 2 - layout["x_padding"]
+    if exclusion_mode == "text":
+        # No exclusion box on the right — only the italic side text
+        # needs horizontal space (clearance to the right of the
+        # centerline, plus roughly one exclusion_box_width of room
+        # for wrapped text, plus padding).
+        right_lim = (
+            center_x + geom["clearance"] + layout["exclusion_box_width"] + layout["x_padding"]
         )
-        ax.add_patch(box)
+    else:
+        right_lim = excl_x + layout["exclusion_box_width"] / 2 + layout["x_padding"]
+    ax.set_xlim(left_lim, right_lim)
+    ax.set_ylim(total_height, 0)
+
+    # Box outlines are built as arrays after the loop (see ``_fast``) and
+    # added as one PathCollection per kind, so Agg draws them in a single
+    # pass instead of one artist per box.  Only the exclusion boxes'
+    # positions are collected here.
+    excl_box_nodes = []
+    excl_box_mid_y = []
+    # Likewise, all connector shafts go into one LineCollection and the
+    # arrowheads into one marker collection per direction, instead of a
+    # FancyArrowPatch per arrow.
+    connector_segments = []
+    junction_dots = []
+    down_tips = []
+    right_tips = []
+    # Data units per point along x and y, for the arrow offsets that
+    # ``annotate`` specifies in points.
+    pt_x = (right_lim - left_lim) / (ax.bbox.width * 72 / fig.dpi)
+    pt_y = total_height / (ax.bbox.height * 72 / fig.dpi)
+    # Vertical arrows use ``annotate``'s default mutation scale (the
+    # font size) and stop 2 points short of the next box (its default
+    # shrink); the horizontal ones are scaled by the style and end on
+    # the exclusion box.
+    connector_lw = lines["connector_linewidth"]
+    down_head, down_setback = _arrowhead(
+        "down", mpl.rcParams["font.size"], connector_lw, filled=False
+    )
+    right_head, right_setback = _arrowhead(
+        "right", lines["arrow_mutation_scale"], connector_lw, filled=True
+    )
+    shrink = 2 * pt_y
+    # Text artists are kept for CohortFlowArtists.
+    title_texts = []
+    body_texts = []
+    excl_texts = {}
+
+    # Loop-invariant style values, bound once rather than looked up per node.
+    main_w = layout["main_box_width"]
+    excl_w = layout["exclusion_box_width"]
+    pad = geom["pad_factor"]
+    text_top = geom["text_top_padding"]
+    title_lh = geom["title_line_height"]
+    title_body_gap = geom["title_body_gap"]
+    clearance = geom["clearance"]
+    # One FontProperties per text role (and heading weight), shared by
+    # all nodes instead of resolving fontsize/fontweight kwargs per call.
+    title_fonts = {
+        weight: FontProperties(size=txt["fontsize_title"], weight=weight)
+        for weight in set(heading_weights)
+    }
+    body_font = FontProperties(size=txt["fontsize_main"])
+    excl_font = FontProperties(size=txt["fontsize_exclusion"], style="italic")
+    junction_r = lines["junction_radius"]
+    main_left = center_x - main_w / 2
+    excl_left = excl_x - excl_w / 2
+
+    for i in range(len(data)):
+        y_pos = centers_y[i]
 
         # ── Text ──
-        text_y = y_pos - node["main_h"] / 2 + geom["text_top_padding"]
-        ax.text(
+        text_y = y_pos - main_h[i] / 2 + text_top
+        title_text = ax.text(
             center_x,
             text_y,
-            "\n".join(node["title_lines"]),
+            title_labels[i],
             ha="center",
             va="top",
-            fontsize=txt["fontsize_title"],
-            fontweight=node["heading_fontweight"],
+            fontproperties=title_fonts[heading_weights[i]],
             zorder=3,
         )
-
-        body_y = (
-            text_y
-            + geom["title_line_height"] * max(1, len(node["title_lines"]))
-            + geom["title_body_gap"]
-        )
-        ax.text(
-            center_x,
-            body_y,
-            "\n".join(node["body_lines"]),
-            ha="center",
-            va="top",
-            fontsize=txt["fontsize_main"],
-            zorder=3,
+        title_texts.append(title_text)
+
+        body_y = text_y + title_lh * max(1, title_line_counts[i]) + title_body_gap
+        body_texts.append(
+            ax.text(
+                center_x,
+                body_y,
+                body_labels[i],
+                ha="center",
+                va="top",
+                fontproperties=body_font,
+                zorder=3,
+            )
         )
 
         # ── Arrow from previous box ──
         if i > 0:
-            prev_btm = centers_y[i - 1] + processed_nodes[i - 1]["main_h"] / 2
-            curr_top = y_pos - node["main_h"] / 2
-            ax.annotate(
-                "",
-                xy=(center_x, curr_top),
-                xytext=(center_x, prev_btm),
-                arrowprops=dict(
-                    arrowstyle="->",
-                    lw=lines["connector_linewidth"],
-                    color="black",
-                ),
-                zorder=1,
+            prev_btm = centers_y[i - 1] + main_h[i - 1] / 2
+            curr_top = y_pos - main_h[i] / 2
+            tip_y = curr_top - shrink
+            connector_segments.append(
+                [
+                    (center_x, prev_btm + pad),
+                    (center_x, tip_y - down_setback * pt_y),
+                ]
             )
+            down_tips.append((center_x, tip_y))
 
             # ── Exclusion: box vs. text ──
-            if node["excl_n"] > 0:
+            if excl_counts[i] > 0:
                 mid_y = (prev_btm + curr_top) / 2
 
                 if exclusion_mode == "text":
                     # Plain italic side text, no box / no junction / no
                     # horizontal arrow. Anchored just to the right of
                     # the vertical arrow (which runs along center_x).
-                    text_x = center_x + geom["clearance"]
-                    ax.text(
+                    text_x = center_x + clearance
+                    excl_texts[i] = ax.text(
                         text_x,
                         mid_y,
-                        "\n".join(node["excl_lines"]),
+                        excl_labels[i],
                         ha="left",
                         va="center",
-                        fontsize=txt["fontsize_exclusion"],
-                        fontstyle="italic",
+                        fontproperties=excl_font,
                         zorder=3,
                     )
                 else:
-                    excl_left = excl_x - layout["exclusion_box_width"] / 2
-
-                    ebox = patches.FancyBboxPatch(
-                        (excl_left, mid_y - node["excl_h"] / 2),
-                        layout["exclusion_box_width"],
-                        node["excl_h"],
-                        boxstyle=(
-                            f"round,pad={geom['pad_factor']},rounding_size={geom['corner_radius']}"
-                        ),
-                        edgecolor="black",
-                        facecolor=node["excl_color"],
-                        linewidth=lines["box_linewidth"],
-                        zorder=2,
-                    )
-                    ax.add_patch(ebox)
+                    excl_box_nodes.append(i)
+                    excl_box_mid_y.append(mid_y)
 
                     # Junction dot & horizontal arrow
-                    ax.add_patch(
-                        patches.Circle(
-                            (center_x, mid_y),
-                            radius=lines["junction_radius"],
-                            facecolor="black",
-                            zorder=4,
-                        )
-                    )
-                    ax.annotate(
-                        "",
-                        xy=(excl_x, mid_y),
-                        xytext=(center_x, mid_y),
-                        arrowprops=dict(
-                            arrowstyle="-|>",
-                            lw=lines["connector_linewidth"],
-                            color="black",
-                            mutation_scale=lines["arrow_mutation_scale"],
-                            patchB=ebox,
-                            shrinkA=0,
-                            shrinkB=0,
-                        ),
-                        zorder=1,
+                    junction_dots.append(patches.Circle((center_x, mid_y), radius=junction_r))
+                    # The arrow ends at the box's padded left edge.
+                    tip_x = excl_left - pad
+                    connector_segments.append(
+                        [(center_x, mid_y), (tip_x - right_setback * pt_x, mid_y)]
                     )
+                    right_tips.append((tip_x, mid_y))
 
-                    ax.text(
+                    excl_texts[i] = ax.text(
                         excl_x,
                         mid_y,
-                        "\n".join(node["excl_lines"]),
+                        excl_labels[i],
                         ha="center",
                         va="center",
-                        fontsize=txt["fontsize_exclusion"],
-                        fontstyle="italic",
+                        fontproperties=excl_font,
                         zorder=3,
                     )
 
-    # ── Set axis limits ──
-    left_lim = center_x - layout["main_box_width"] / 2 - layout["x_padding"]
-    if exclusion_mode == "text":
-        # No exclusion box on the right — only the italic side text
-        # needs horizontal space (clearance to the right of the
-        # centerline, plus roughly one exclusion_box_width of room
-        # for wrapped text, plus padding).
-        right_lim = (
-            center_x + geom["clearance"] + layout["exclusion_box_width"] + layout["x_padding"]
+    # Each collection gets a ``gid`` so it can be found on the axes (and
+    # is named in SVG output).
+    corner_radius = geom["corner_radius"]
+    main_paths = box_paths(main_left, centers_y - main_h / 2, main_w, main_h, pad, corner_radius)
+    excl_paths = []
+    if excl_box_nodes:
+        box_h = excl_h[excl_box_nodes]
+        excl_paths = box_paths(
+            excl_left, np.array(excl_box_mid_y) - box_h / 2, excl_w, box_h, pad, corner_radius
         )
-    else:
-        right_lim = excl_x + layout["exclusion_box_width"] / 2 + layout["x_padding"]
-    ax.set_xlim(left_lim, right_lim)
-    ax.set_ylim(total_height, 0)
+
+    box_collections = {}
+    for gid, paths, facecolors in (
+        ("main_boxes", main_paths, main_colors),
+        ("exclusion_boxes", excl_paths, excl_colors[excl_box_nodes]),
+    ):
+        if paths:
+            box_collections[gid] = ax.add_collection(
+                PathCollection(
+                    paths,
+                    facecolors=facecolors,
+                    edgecolors="black",
+                    linewidths=lines["box_linewidth"],
+                    zorder=2,
+                    gid=gid,
+                ),
+                autolim=False,
+            )
+
+    if connector_segments:
+        ax.add_collection(
+            LineCollection(
+                connector_segments,
+                colors="black",
+                linewidths=connector_lw,
+                zorder=1,
+                gid="connectors",
+            ),
+            autolim=False,
+        )
+    if junction_dots:
+        # Radii stay in data units, as with the former per-dot patches.
+        ax.add_collection(
+            PatchCollection(
+                junction_dots, facecolors="black", edgecolors="none", zorder=4, gid="junctions"
+            ),
+            autolim=False,
+        )
+    _add_arrowheads(
+        ax,
+        down_tips,
+        down_head,
+        facecolors="none",
+        edgecolors="black",
+        linewidths=connector_lw,
+        zorder=1,
+        gid="connector_heads",
+    )
+    _add_arrowheads(
+        ax,
+        right_tips,
+        right_head,
+        facecolors="black",
+        edgecolors="black",
+        linewidths=connector_lw,
+        zorder=1,
+        gid="exclusion_heads",
+    )
 
     # In text mode, re-anchor the figure title above the main column so
     # it aligns with the boxes. Matplotlib's default centers the title
@@ -456,4 +785,17 @@ def plot_cfd(
     if img_name:
         save_figure(fig, save_dir, img_name, save_format, verbose=verbose)
 
+    if return_artists:
+        artists = CohortFlowArtists(
+            fig=fig,
+            ax=ax,
+            layout=layout_signature,
+            main_boxes=box_collections["main_boxes"],
+            exclusion_boxes=box_collections.get("exclusion_boxes"),
+            exclusion_box_nodes=excl_box_nodes,
+            title_texts=title_texts,
+            body_texts=body_texts,
+            exclusion_texts=excl_texts,
+        )
+        return fig, ax, artists
     return fig, ax
@@ -7,6 +7,12 @@ TOML-based style configuration loading used internally by
 
 from __future__ import annotations
 
+import copy
+import functools
+import logging
+import os
+import re
+import sys
 import textwrap
 import warnings
 from importlib import resources
@@ -15,12 +21,14 @@ from importlib.metadata import metadata as _metadata
 from pathlib import Path
 from typing import Any
 
-try:
-    import tomllib  # Python 3.11+
-except ImportError:
-    import tomli as tomllib  # Python < 3.11
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
 
+import matplotlib as mpl
 import matplotlib.colors as mcolors
+import numpy as np
 
 __all__ = [
     "save_figure",
@@ -33,6 +41,8 @@ __all__ = [
     "apply_kwarg_overrides",
 ]
 
+logger = logging.getLogger(__name__)
+
 # Mapping of built-in style short-names to TOML file names inside the
 # ``styles/`` sub-package shipped with pycohortflow.
 _BUILTIN_STYLES = {
@@ -92,11 +102,19 @@ def _package_version() -> str:
 # ---------------------------------------------------------------------------
 
 
-def save_figure(fig, save_dir, img_name, save_format, verbose=False):
+# Output directories already created by save_figure in this process, so
+# batch runs writing into the same folder skip the mkdir syscalls.
+_ENSURED_DIRS: set[Path] = set()
+
+
+def save_figure(fig, save_dir, img_name, save_format, verbose=False, tight=True):
     """Save a Matplotlib figure to disk in one or more formats.
 
     The function creates *save_dir* if it does not already exist and writes
-    the figure for every format listed in *save_format*.
+    the figure for every format listed in *save_format*.  The tight
+    bounding box is computed once and shared by all formats.  Every file
+    written is also logged at ``INFO`` level on the ``pycohortflow``
+    logger hierarchy.
 
     Args:
         fig (matplotlib.figure.Figure): The figure object to save.
@@ -107,6 +125,9 @@ def save_figure(fig, save_dir, img_name, save_format, verbose=False):
             or a list of format strings (e.g. ``["png", "svg", "pdf"]``).
         verbose (bool): When ``True``, print a ``Saved: <path>`` line
             for every file written.  Defaults to ``False`` (silent).
+        tight (bool): Crop the output to the drawn content
+            (``bbox_inches="tight"``).  Pass ``False`` to keep the full
+            figure canvas, e.g. when the layout was already finalised.
 
     Returns:
         None
@@ -121,15 +142,34 @@ def save_figure(fig, save_dir, img_name, save_format, verbose=False):
         return
 
     output_dir = Path(save_dir) if save_dir is not None else Path(".")
-    output_dir.mkdir(parents=True, exist_ok=True)
+    dir_key = output_dir.absolute()
+    if dir_key not in _ENSURED_DIRS:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(dir_key)
 
     if isinstance(save_format, str):
         save_format = [save_format]
 
+    # ``bbox_inches="tight"`` measures the figure with a full render on
+    # every savefig call; with several formats, measure once up front and
+    # pad it the way savefig would.  The figure is drawn first so that
+    # layout engines (constrained/tight layout) have placed everything.
+    bbox_inches = "tight" if tight else None
+    get_renderer = getattr(fig.canvas, "get_renderer", None)
+    if tight and len(save_format) > 1 and get_renderer is not None:
+        fig.canvas.draw()
+        bbox_inches = fig.get_tightbbox(get_renderer()).padded(mpl.rcParams["savefig.pad_inches"])
+
     for fmt in save_format:
         clean_fmt = fmt.lstrip(".")
-        full_path = output_dir / f"{img_name}.{clean_fmt}"
-        fig.savefig(full_path, bbox_inches="tight", dpi=fig.dpi)
+        full_path = output_dir.joinpath(f"{img_name}.{clean_fmt}")
+        try:
+            fig.savefig(full_path, bbox_inches=bbox_inches, dpi=fig.dpi)
+        except FileNotFoundError:
+            # The directory was removed since it was first created.
+            output_dir.mkdir(parents=True, exist_ok=True)
+            fig.savefig(full_path, bbox_inches=bbox_inches, dpi=fig.dpi)
+        logger.info("Saved: %s", full_path)
         if verbose:
             print(f"Saved: {full_path}")
 
@@ -139,29 +179,70 @@ def save_figure(fig, save_dir, img_name, save_format, verbose=False):
 # ---------------------------------------------------------------------------
 
 
-def wrap_lines(text, width):
+def wrap_lines(text, width, *, break_on_hyphens=False):
     """Wrap a string into a list of lines that fit within *width* characters.
 
     Uses :func:`textwrap.wrap` with ``break_long_words=False`` so that words
-    are never split mid-word.
+    are never split mid-word.  Lines are broken at whitespace only, like
+    the Interactive Generator; hyphenated words stay whole unless
+    *break_on_hyphens* is set.
 
     Args:
         text (str): The input string to wrap.
         width (int): Maximum number of characters per line.
+        break_on_hyphens (bool): Also allow breaks after hyphens in
+            compound words, as :func:`textwrap.wrap` does by default.
 
     Returns:
         list[str]: Wrapped lines.  Returns an empty list for blank input
-        and a single-element list when the text cannot be broken.
+        and a single-element list when the text cannot be broken or
+        *width* is not positive.
 
     Example:
         >>> wrap_lines("A rather long description text", width=15)
         ['A rather long', 'description', 'text']
+        >>> wrap_lines("Lost to follow-up", width=15)
+        ['Lost to', 'follow-up']
+        >>> wrap_lines("Lost to follow-up", width=15, break_on_hyphens=True)
+        ['Lost to follow-', 'up']
 
+    """
+    return list(_wrap_cached(text, width, break_on_hyphens))
+
+
+@functools.lru_cache(maxsize=512)
+def _wrap_cached(text, width, break_on_hyphens):
+    """Memoised core of :func:`wrap_lines`, returning an immutable tuple.
+
+    Diagrams are often redrawn with the same headings and descriptions
+    while only the counts change, so the same strings are wrapped again
+    and again.  :func:`~pycohortflow.cfd.plot_cfd` calls this directly,
+    as it only joins and counts the lines.  All arguments are required
+    and should be passed positionally: ``lru_cache`` keys on the call
+    form, so ``(text, width)`` and ``(text, width=width)`` would not
+    share entries with :func:`wrap_lines`.
     """
     if not text:
-        return []
-    wrapped = textwrap.wrap(text, width=width, break_long_words=False)
-    return wrapped or [text]
+        return ()
+    # Most headings fit on one line; skip textwrap when it would return
+    # the text unchanged (no whitespace to normalise or strip).
+    if len(text) <= width and text.isprintable() and text == text.strip():
+        return (text,)
+    if width <= 0:
+        return (text,)
+    return tuple(_get_wrapper(width, break_on_hyphens).wrap(text)) or (text,)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_wrapper(width, break_on_hyphens):
+    """Return a shared :class:`textwrap.TextWrapper` for these options.
+
+    A diagram only uses the few widths configured in the style's
+    ``[layout]`` section, so each wrapper is built once.
+    """
+    return textwrap.TextWrapper(
+        width=width, break_long_words=False, break_on_hyphens=break_on_hyphens
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -169,6 +250,40 @@ def wrap_lines(text, width):
 # ---------------------------------------------------------------------------
 
 
+# Plain ``#rgb``, ``#rrggbb`` and ``#rrggbbaa`` strings in either case.
+# These are normalised directly, skipping Matplotlib's (pure-Python)
+# colour parser; named colours, ``C0``, ``tab:`` etc. still go through it.
+_HEX_RE = re.compile(r"#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})").fullmatch
+
+
+def _normalise_hex(value):
+    """Return a plain hex colour string as lowercase ``#rrggbb``.
+
+    Args:
+        value: Any colour specification.
+
+    Returns:
+        str | None: The normalised hex string (alpha dropped, ``#rgb``
+        expanded), or ``None`` if *value* is not a plain hex string.
+
+    """
+    if not isinstance(value, str) or not _HEX_RE(value):
+        return None
+    if len(value) == 4:
+        value = "#" + value[1] * 2 + value[2] * 2 + value[3] * 2
+    return value[:7].lower()
+
+
+def _to_hex_fast(value):
+    """Like ``mcolors.to_hex(value, keep_alpha=False)``, skipping plain hex.
+
+    Raises:
+        ValueError: If *value* is not a valid colour specification.
+
+    """
+    return _normalise_hex(value) or mcolors.to_hex(value, keep_alpha=False)
+
+
 def get_matplotlib_named_colors():
     """Return a sorted list of all Matplotlib named colour strings.
 
@@ -183,7 +298,13 @@ def get_matplotlib_named_colors():
         True
 
     """
-    return sorted(mcolors.get_named_colors_mapping().keys())
+    return list(_get_named_colors_cached())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_named_colors_cached():
+    """Sorted Matplotlib colour names, computed once per process."""
+    return tuple(sorted(mcolors.get_named_colors_mapping().keys()))
 
 
 def named_color(name):
@@ -204,7 +325,7 @@ def named_color(name):
         '#ffffff'
 
     """
-    return mcolors.to_hex(name, keep_alpha=False)
+    return _to_hex_fast(name)
 
 
 def _hex_to_rgb(hex_color):
@@ -221,7 +342,12 @@ def _hex_to_rgb(hex_color):
     hex_color = hex_color.lstrip("#")
     if len(hex_color) == 8:  # #RRGGBBAA → strip alpha
         hex_color = hex_color[:6]
-    return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+    if len(hex_color) != 6:
+        raise ValueError(f"Expected a #RRGGBB hex colour, got {hex_color!r}.")
+    # bytes.fromhex decodes all three channels in one C call; it beat
+    # both int(..., 16) with shifts and a pair-to-int lookup table.
+    r, g, b = bytes.fromhex(hex_color)
+    return r, g, b
 
 
 def _rgb_to_hex(rgb):
@@ -234,7 +360,7 @@ def _rgb_to_hex(rgb):
         str: Lowercase hex colour string.
 
     """
-    return "#{:02x}{:02x}{:02x}".format(*rgb)
+    return "#" + bytes(rgb).hex()
 
 
 def _interpolate_color(start_hex, end_hex, t):
@@ -276,13 +402,50 @@ def gradient_palette(start_hex, end_hex, n):
         ['#000000', '#808080', '#ffffff']
 
     """
-    if n <= 0:
-        return []
-    if n == 1:
-        return [mcolors.to_hex(start_hex, keep_alpha=False)]
-    s_hex = mcolors.to_hex(start_hex, keep_alpha=False)
-    e_hex = mcolors.to_hex(end_hex, keep_alpha=False)
-    return [_interpolate_color(s_hex, e_hex, i / (n - 1)) for i in range(n)]
+    return ["#%02x%02x%02x" % tuple(rgb) for rgb in _gradient_rgb(start_hex, end_hex, n).tolist()]
+
+
+def _gradient_rgba(start_hex, end_hex, n):
+    """Return the :func:`gradient_palette` colours as an ``(n, 4)`` RGBA array.
+
+    Lets :func:`~pycohortflow.plot_cfd` hand the palette straight to its
+    box collections without formatting and re-parsing hex strings.  The
+    array is a fresh, writable copy.
+    """
+    rgb = _gradient_rgb(start_hex, end_hex, n)
+    return np.column_stack((rgb / 255.0, np.ones(len(rgb))))
+
+
+def _gradient_rgb(start_hex, end_hex, n):
+    """Return the gradient as a read-only ``(n, 3)`` ``uint8`` array.
+
+    Gradients are deterministic in their inputs and requested once per
+    figure, so string endpoints are served from a cache (other colour
+    specs may be unhashable).
+    """
+    if isinstance(start_hex, str) and isinstance(end_hex, str):
+        return _gradient_rgb_cached(start_hex, end_hex, n)
+    return _gradient_rgb_uncached(start_hex, end_hex, n)
+
+
+def _gradient_rgb_uncached(start_hex, end_hex, n):
+    """Compute :func:`_gradient_rgb` in one vectorised blend.
+
+    Channels are blended in 0–255 space with ``t = i / (n - 1)`` and
+    rounded half-to-even, exactly like :func:`_interpolate_color`.
+    """
+    n = max(n, 0)
+    # Endpoints are quantised to 0–255 integers first, as the hex strings
+    # would be; ``t`` is divided (not ``linspace``) to match bit for bit.
+    start = np.array(_hex_to_rgb(_to_hex_fast(start_hex)), dtype=float)
+    end = np.array(_hex_to_rgb(_to_hex_fast(end_hex)), dtype=float)
+    t = np.arange(n).reshape(-1, 1) / max(n - 1, 1)
+    rgb = np.rint(start + (end - start) * t).astype(np.uint8)
+    rgb.flags.writeable = False
+    return rgb
+
+
+_gradient_rgb_cached = functools.lru_cache(maxsize=64)(_gradient_rgb_uncached)
 
 
 def resolve_color(color_value, default_value, allow_named_colors=True):
@@ -320,13 +483,15 @@ def resolve_color(color_value, default_value, allow_named_colors=True):
             f"Unsupported color '{value}' when allow_named_colors=False. "
             "Use hex colors like '#88ccff'."
         )
-    try:
-        return mcolors.to_hex(value, keep_alpha=False)
-    except ValueError as exc:
+    hex_value = _normalise_hex(value)
+    if hex_value is not None:
+        return hex_value
+    if not mcolors.is_color_like(value):
         raise ValueError(
             f"Unsupported color '{value}'. Use hex or Matplotlib named colors. "
             "See get_matplotlib_named_colors()."
-        ) from exc
+        )
+    return mcolors.to_hex(value, keep_alpha=False)
 
 
 # ---------------------------------------------------------------------------
@@ -349,12 +514,23 @@ def _recursive_update(default, override):
         dict: A new dictionary with merged values.
 
     """
+    if not override:
+        return {**default}
+    # Merged with an explicit stack rather than recursion, so deeply
+    # nested user configs cannot hit the interpreter's recursion limit.
+    # Nested dicts are copied before being written to, which keeps
+    # *default* (and cached configs built from it) untouched.
     result = {**default}
-    for key, value in override.items():
-        if isinstance(value, dict) and key in result and isinstance(result[key], dict):
-            result[key] = _recursive_update(result[key], value)
-        else:
-            result[key] = value
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                target[key] = merged = {**current}
+                stack.append((merged, value))
+            else:
+                target[key] = value
     return result
 
 
@@ -392,118 +568,172 @@ def load_style_config(style="white", custom_config_path=None):
         >>> cfg = load_style_config("colorful", "my_overrides.toml")
 
     """
-    # 1. Resolve built-in style
     if style not in _BUILTIN_STYLES:
         raise ValueError(
             f"Unknown built-in style '{style}'. Available styles: {sorted(_BUILTIN_STYLES)}"
         )
 
-    toml_filename = _BUILTIN_STYLES[style]
-
-    # Minimal hard-coded fallback (white style base)
-    _fallback_config = {
-        "figure": {
-            "dpi": 200,
-            "figsize_width": 12,
-            "figsize_height": 8,
-            "title_fontsize": 16,
-            "title_fontweight": "bold",
-            "title_pad": 20,
-        },
-        "layout": {
-            "main_title_width": 26,
-            "main_text_width": 34,
-            "exclusion_text_width": 30,
-            "main_box_width": 2.8,
-            "exclusion_box_width": 2.6,
-            "base_gap": 0.8,
-            "side_gap": 1.2,
-            "top_margin": 0.8,
-            "bottom_margin": 0.8,
-            "x_padding": 0.6,
-        },
-        "box_geometry": {
-            "padding": 0.52,
-            "title_line_height": 0.42,
-            "body_line_height": 0.33,
-            "title_body_gap": 0.16,
-            "text_top_padding": 0.24,
-            "min_main_height": 1.6,
-            "min_exclusion_height": 1.2,
-            "clearance": 0.2,
-            "corner_radius": 0.05,
-            "pad_factor": 0.03,
-        },
-        "text": {
-            "fontsize_title": 12,
-            "fontsize_main": 10,
-            "fontsize_exclusion": 9,
-            "heading_fontweight": "bold",
-        },
-        "lines": {
-            "box_linewidth": 1,
-            "connector_linewidth": 1,
-            "arrow_mutation_scale": 20,
-            "junction_radius": 0.004,
-        },
-        "colors": {
-            "allow_named_colors": True,
-            "main_start": "#ffffff",
-            "main_end": "#ffffff",
-            "exclusion_start": "#ffffff",
-            "exclusion_end": "#ffffff",
-        },
-        "exclusion": {
-            "mode": "box",
-        },
-    }
+    # The custom file's modification time is part of the cache key, so
+    # edits to it are picked up on the next call.
+    custom_mtime = None
+    if custom_config_path:
+        try:
+            custom_mtime = os.stat(custom_config_path).st_mtime_ns
+        except OSError:
+            warnings.warn(
+                f"Custom config path '{custom_config_path}' does not exist. Ignoring.",
+                stacklevel=2,
+            )
+            custom_config_path = None
+        else:
+            custom_config_path = os.fspath(custom_config_path)
+
+    # Callers mutate the returned dict (e.g. apply_kwarg_overrides), so
+    # hand out a copy and keep the cached tree pristine.
+    return copy.deepcopy(_load_style_config_cached(style, custom_config_path, custom_mtime))
+
+
+# Minimal hard-coded fallback (white style base), used when the bundled
+# TOML files cannot be read from the package data.
+_HARDCODED_FALLBACK = {
+    "figure": {
+        "dpi": 200,
+        "figsize_width": 12,
+        "figsize_height": 8,
+        "title_fontsize": 16,
+        "title_fontweight": "bold",
+        "title_pad": 20,
+    },
+    "layout": {
+        "main_title_width": 26,
+        "main_text_width": 34,
+        "exclusion_text_width": 30,
+        "main_box_width": 2.8,
+        "exclusion_box_width": 2.6,
+        "base_gap": 0.8,
+        "side_gap": 1.2,
+        "top_margin": 0.8,
+        "bottom_margin": 0.8,
+        "x_padding": 0.6,
+    },
+    "box_geometry": {
+        "padding": 0.52,
+        "title_line_height": 0.42,
+        "body_line_height": 0.33,
+        "title_body_gap": 0.16,
+        "text_top_padding": 0.24,
+        "min_main_height": 1.6,
+        "min_exclusion_height": 1.2,
+        "clearance": 0.2,
+        "corner_radius": 0.05,
+        "pad_factor": 0.03,
+    },
+    "text": {
+        "fontsize_title": 12,
+        "fontsize_main": 10,
+        "fontsize_exclusion": 9,
+        "heading_fontweight": "bold",
+    },
+    "lines": {
+        "box_linewidth": 1,
+        "connector_linewidth": 1,
+        "arrow_mutation_scale": 20,
+        "junction_radius": 0.004,
+    },
+    "colors": {
+        "allow_named_colors": True,
+        "main_start": "#ffffff",
+        "main_end": "#ffffff",
+        "exclusion_start": "#ffffff",
+        "exclusion_end": "#ffffff",
+    },
+    "exclusion": {
+        "mode": "box",
+    },
+}
 
-    # Colorful style overrides for the fallback path
-    _colorful_overrides = {
+# Per-style differences from the white base, applied on the fallback path.
+_FALLBACK_STYLE_OVERRIDES = {
+    "colorful": {
         "colors": {
             "main_start": "#dff1ff",
             "main_end": "#dff7e8",
             "exclusion_start": "#f8cccc",
             "exclusion_end": "#fee8e8",
         },
-    }
-
-    # Minimal style overrides for the fallback path
-    _minimal_overrides = {
+    },
+    "minimal": {
         "text": {
             "heading_fontweight": "normal",
         },
         "exclusion": {
             "mode": "text",
         },
-    }
+    },
+}
 
-    try:
-        style_file = resources.files("pycohortflow").joinpath("styles").joinpath(toml_filename)
-        config = tomllib.loads(style_file.read_text(encoding="utf-8"))
-    except (FileNotFoundError, OSError, tomllib.TOMLDecodeError) as exc:
-        warnings.warn(
-            f"Could not load built-in style '{style}' from package data: {exc}. "
-            "Falling back to hard-coded defaults.",
-            stacklevel=2,
-        )
-        config = _fallback_config
-        if style == "colorful":
-            config = _recursive_update(config, _colorful_overrides)
-        elif style == "minimal":
-            config = _recursive_update(config, _minimal_overrides)
+
+@functools.lru_cache(maxsize=16)
+def _load_style_config_cached(style, custom_config_path, custom_mtime):
+    """Merge the custom TOML file onto a pre-parsed built-in style.
+
+    Backs :func:`load_style_config`.  Results are memoised on all three
+    arguments.  *custom_mtime* is not used in the body; it only keys the
+    cache so that an edited custom file is re-read.  Must not be mutated
+    by callers.
+    """
+    # 1. Start from the pre-parsed built-in style
+    config = _BUILTIN_STYLE_CACHE[style]
 
     # 2. Merge user overrides
     if custom_config_path:
-        custom_path = Path(custom_config_path)
-        if custom_path.exists():
-            with open(custom_path, "rb") as f:
+        try:
+            with open(custom_config_path, "rb") as f:
                 user_config = tomllib.load(f)
-            config = _recursive_update(config, user_config)
-        else:
+        except FileNotFoundError:
+            # Removed after load_style_config stat'ed it.
             warnings.warn(
                 f"Custom config path '{custom_config_path}' does not exist. Ignoring.",
-                stacklevel=2,
+                stacklevel=3,
             )
+        else:
+            config = _recursive_update(config, user_config)
 
     return config
+
+
+def _preload_builtin_styles():
+    """Parse every bundled style TOML file once, at import time.
+
+    Styles that cannot be read from the package data fall back to
+    :data:`_HARDCODED_FALLBACK` (plus the style's overrides) with a
+    warning, so :func:`load_style_config` never touches the package
+    resources itself.
+
+    Returns:
+        dict[str, dict]: Parsed configuration per built-in style name.
+            Must not be mutated.
+
+    """
+    styles = {}
+    for style, toml_filename in _BUILTIN_STYLES.items():
+        try:
+            style_file = resources.files("pycohortflow").joinpath("styles").joinpath(toml_filename)
+            with style_file.open("rb") as f:
+                styles[style] = tomllib.load(f)
+        except (FileNotFoundError, OSError, tomllib.TOMLDecodeError) as exc:
+            warnings.warn(
+                f"Could not load built-in style '{style}' from package data: {exc}. "
+                "Falling back to hard-coded defaults.",
+                stacklevel=2,
+            )
+            styles[style] = _recursive_update(
+                _HARDCODED_FALLBACK, _FALLBACK_STYLE_OVERRIDES.get(style, {})
+            )
+    return styles
+
+
+_BUILTIN_STYLE_CACHE = _preload_builtin_styles()
+
+# Lets tests (and long-running sessions) drop every cached configuration.
+load_style_config.cache_clear = _load_style_config_cached.cache_clear
@@ -1,12 +1,20 @@
 """Tests for pycohortflow.cfd — the main plotting function."""
 
+import logging
+import subprocess
+import sys
+
 import matplotlib
 import matplotlib.pyplot as plt
+import numpy as np
 import pytest
+from matplotlib.patches import ArrowStyle, BoxStyle, FancyBboxPatch
+from matplotlib.path import Path
 
 matplotlib.use("Agg")  # non-interactive backend for CI
 
 from pycohortflow import plot_cfd
+from pycohortflow.cfd import CohortFlowArtists, _arrowhead
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -39,6 +47,21 @@ def single_node():
     return [{"heading": "Total", "N": 200}]
 
 
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def box_paths(ax):
+    """Return the paths of all main and exclusion boxes drawn on *ax*."""
+    return [
+        path
+        for c in ax.collections
+        if c.get_gid() in ("main_boxes", "exclusion_boxes")
+        for path in c.get_paths()
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Basic behaviour
 # ---------------------------------------------------------------------------
@@ -69,6 +92,36 @@ class TestBasicPlotting:
         assert ax.get_title() == "My Title"
         plt.close(fig)
 
+    def test_blank_exclusion_description(self):
+        """Verify a blank exclusion description leaves only the count."""
+        data = [
+            {"heading": "A", "N": 10},
+            {"heading": "B", "N": 5, "exclusion_description": ""},
+            {"heading": "C", "N": 3, "exclusion_description": "   "},
+        ]
+        fig, ax, artists = plot_cfd(data, return_artists=True)
+        assert artists.exclusion_texts[1].get_text() == "(n = 5)"
+        assert artists.exclusion_texts[2].get_text() == "(n = 2)"
+        plt.close(fig)
+
+    def test_arrowheads_match_annotate(self):
+        """The marker arrowheads reproduce ``annotate``'s arrow heads.
+
+        Same outline and the same setback of the tip for the stroke as
+        Matplotlib's ``"->"`` (vertical) and ``"-|>"`` (exclusion) styles.
+        """
+        for style, direction, filled, shaft in (
+            ("->", "down", False, Path([(0.0, 50.0), (0.0, 0.0)])),
+            ("-|>", "right", True, Path([(-50.0, 0.0), (0.0, 0.0)])),
+        ):
+            (line, expected), _ = ArrowStyle(style)(shaft, 10.0, 1.5)
+            head, setback = _arrowhead(direction, 10.0, 1.5, filled)
+            assert np.abs(line.vertices[-1]).max() == pytest.approx(setback)
+            verts = head.vertices[:3]
+            if direction == "down":
+                verts = verts[::-1]
+            np.testing.assert_allclose(verts, expected.vertices[:3])
+
 
 # ---------------------------------------------------------------------------
 # External axes
@@ -101,6 +154,17 @@ class TestExternalAxes:
         assert host_ax.get_title() == "Custom"
         plt.close(fig)
 
+    def test_provided_axes_do_not_import_pyplot(self):
+        """Verify drawing on a bare Figure's axes never imports pyplot."""
+        code = (
+            "import sys\n"
+            "from matplotlib.figure import Figure\n"
+            "from pycohortflow import plot_cfd\n"
+            "plot_cfd([{'N': 10}, {'N': 8}], ax=Figure().add_subplot())\n"
+            "assert 'matplotlib.pyplot' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
 
 # ---------------------------------------------------------------------------
 # Style selection
@@ -117,20 +181,18 @@ class TestStyles:
     """
 
     def test_minimal_style_skips_exclusion_boxes(self, sample_data):
-        """Verify 'minimal' style draws no exclusion FancyBboxPatch.
+        """Verify 'minimal' style draws no exclusion boxes.
 
-        In box mode each non-final step adds an exclusion FancyBboxPatch
-        on top of the main one (so a 3-node sample has 3 main + 2
-        exclusion = 5 FancyBboxPatch instances). In text mode only the
-        3 main boxes should be present.
+        Boxes are batched into one collection per kind. In box mode each
+        non-final step adds an exclusion box on top of the main one (so a
+        3-node sample has 3 main + 2 exclusion = 5 box paths). In text
+        mode only the 3 main boxes should be present.
         """
-        from matplotlib.patches import FancyBboxPatch
-
         fig_box, ax_box = plot_cfd(sample_data, style="white")
         fig_text, ax_text = plot_cfd(sample_data, style="minimal")
 
-        n_box = sum(isinstance(p, FancyBboxPatch) for p in ax_box.patches)
-        n_text = sum(isinstance(p, FancyBboxPatch) for p in ax_text.patches)
+        n_box = len(box_paths(ax_box))
+        n_text = len(box_paths(ax_text))
         assert n_text == len(sample_data)
         assert n_text < n_box
         plt.close(fig_box)
@@ -180,6 +242,67 @@ class TestHeadingFontweight:
         plt.close(fig)
 
 
+# ---------------------------------------------------------------------------
+# Reusing a drawn diagram
+# ---------------------------------------------------------------------------
+
+
+class TestReuse:
+    """Tests for return_artists and in-place updates via reuse."""
+
+    def test_return_artists(self, sample_data):
+        """Verify return_artists adds the artist handles as a third element."""
+        fig, ax, artists = plot_cfd(sample_data, return_artists=True)
+        assert isinstance(artists, CohortFlowArtists)
+        assert artists.ax is ax
+        assert len(artists.title_texts) == len(sample_data)
+        assert sorted(artists.exclusion_texts) == [1, 2]
+        plt.close(fig)
+
+    def test_reuse_updates_in_place(self, sample_data):
+        """Verify reuse rewrites texts and colours without adding artists."""
+        fig, ax, artists = plot_cfd(sample_data, return_artists=True)
+        n_texts, n_collections = len(ax.texts), len(ax.collections)
+
+        data = [dict(d) for d in sample_data]
+        data[1]["N"] = 79
+        data[0]["color"] = "#ff0000"
+        ret_fig, ret_ax, ret_artists = plot_cfd(data, reuse=artists)
+
+        assert (ret_fig, ret_ax, ret_artists) == (fig, ax, artists)
+        assert len(ax.texts) == n_texts
+        assert len(ax.collections) == n_collections
+        assert artists.body_texts[1].get_text() == "(n = 79)"
+        assert "n = 21" in artists.exclusion_texts[1].get_text()
+        assert tuple(artists.main_boxes.get_facecolor()[0]) == (1.0, 0.0, 0.0, 1.0)
+        assert artists.background is not None
+        plt.close(fig)
+
+    def test_reuse_with_changed_layout_raises(self, sample_data):
+        """Verify reuse refuses data that would move or resize boxes."""
+        fig, ax, artists = plot_cfd(sample_data, return_artists=True)
+        with pytest.raises(ValueError, match="same diagram layout"):
+            plot_cfd(sample_data[:2], reuse=artists)
+        plt.close(fig)
+
+    def test_reuse_with_rewrapped_heading_raises(self, sample_data, tmp_path):
+        """Verify reuse refuses a heading that wraps onto more lines.
+
+        With a tall minimum box height the box does not grow, but the
+        body text would have to move down below the longer title.
+        """
+        toml_file = tmp_path / "tall.toml"
+        toml_file.write_text("[box_geometry]\nmin_main_height = 4.0\n")
+        fig, ax, artists = plot_cfd(
+            sample_data, style_config_path=str(toml_file), return_artists=True
+        )
+        data = [dict(d) for d in sample_data]
+        data[0]["heading"] = "Registered patients across all participating study sites"
+        with pytest.raises(ValueError, match="same diagram layout"):
+            plot_cfd(data, style_config_path=str(toml_file), reuse=artists)
+        plt.close(fig)
+
+
 # ---------------------------------------------------------------------------
 # Transparent background
 # ---------------------------------------------------------------------------
@@ -228,6 +351,16 @@ class TestSaving:
         )
         assert (tmp_path / "cwd_chart.png").exists()
 
+    def test_saved_files_are_logged(self, sample_data, tmp_path, caplog):
+        """Verify each saved format is logged, without printing by default."""
+        with caplog.at_level(logging.INFO, logger="pycohortflow"):
+            fig, ax = plot_cfd(
+                sample_data, save_dir=tmp_path, img_name="chart", save_format=["png", "svg"]
+            )
+        saved = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Saved:")]
+        assert saved == [f"Saved: {tmp_path / 'chart.png'}", f"Saved: {tmp_path / 'chart.svg'}"]
+        plt.close(fig)
+
 
 # ---------------------------------------------------------------------------
 # Validation
@@ -297,6 +430,36 @@ class TestCustomConfig:
         assert fig.dpi == pytest.approx(72)
         plt.close(fig)
 
+    def test_zero_corner_radius_draws_square_boxes(self, sample_data, tmp_path):
+        """Verify corner_radius = 0 yields plain four-cornered box outlines."""
+        toml_file = tmp_path / "square.toml"
+        toml_file.write_text("[box_geometry]\ncorner_radius = 0\n")
+
+        fig, ax = plot_cfd(sample_data, style_config_path=str(toml_file))
+        paths = box_paths(ax)
+        assert len(paths) == 5
+        assert all(len(path.vertices) == 5 for path in paths)
+        plt.close(fig)
+
+    def test_rounded_boxes_match_fancybboxpatch(self, sample_data):
+        """Verify the array-built outlines equal Matplotlib's Round box style."""
+        fig, ax = plot_cfd(sample_data, style="white")
+        main = next(c for c in ax.collections if c.get_gid() == "main_boxes")
+        path = main.get_paths()[0]
+
+        x, y = path.vertices.min(axis=0)
+        w, h = np.ptp(path.vertices, axis=0)
+        pad, radius = 0.03, 0.05  # default_style_white.toml
+        ref = FancyBboxPatch(
+            (x + pad, y + pad),
+            w - 2 * pad,
+            h - 2 * pad,
+            boxstyle=BoxStyle("Round", pad=pad, rounding_size=radius),
+        ).get_path()
+        np.testing.assert_allclose(path.vertices, ref.vertices)
+        np.testing.assert_array_equal(path.codes, ref.codes)
+        plt.close(fig)
+
     def test_missing_toml_warns(self, sample_data):
         """Verify a missing TOML path emits a warning instead of crashing."""
         with pytest.warns(UserWarning, match="does not exist"):
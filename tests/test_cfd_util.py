@@ -1,18 +1,91 @@
 """Tests for pycohortflow.cfd_util — utility functions."""
 
+import os
+import re
+import shutil
+import sys
+import textwrap
+
+import numpy as np
 import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_hex
+from matplotlib.figure import Figure
+from matplotlib.image import imread
 
+from pycohortflow import cfd_util, plot_cfd
 from pycohortflow.cfd_util import (
+    _gradient_rgba,
     _hex_to_rgb,
     _interpolate_color,
+    _load_style_config_cached,
     _recursive_update,
     _rgb_to_hex,
+    get_matplotlib_named_colors,
     gradient_palette,
     load_style_config,
+    named_color,
     resolve_color,
+    save_figure,
     wrap_lines,
 )
 
+# ---------------------------------------------------------------------------
+# save_figure
+# ---------------------------------------------------------------------------
+
+
+class TestSaveFigure:
+    """Tests for writing figures to disk."""
+
+    def test_tight_false_keeps_full_canvas(self, tmp_path):
+        """Verify tight=False saves the whole figure instead of cropping."""
+        fig = Figure(figsize=(4, 3), dpi=50)
+        fig.add_subplot().plot([0, 1])
+        save_figure(fig, tmp_path, "full", "png", tight=False)
+        assert imread(tmp_path / "full.png").shape[:2] == (150, 200)
+
+    def test_multi_format_matches_tight_with_layout_engine(self, tmp_path):
+        """Verify the shared bbox matches savefig's own tight bbox.
+
+        Constrained layout only positions the axes during a draw, so the
+        bbox shared across formats must be measured after one.
+        """
+        fig = Figure(layout="constrained")
+        FigureCanvasAgg(fig)
+        for ax in fig.subplots(2, 2).flat:
+            ax.set_title("Title")
+            ax.set_ylabel("A long y-axis label")
+        save_figure(fig, tmp_path, "multi", ["png", "svg"])
+        save_figure(fig, tmp_path, "single", "png")
+        multi = imread(tmp_path / "multi.png")
+        single = imread(tmp_path / "single.png")
+        assert multi.shape == single.shape
+        assert (multi == single).all()
+
+    def test_vector_formats_keep_raster_resolution(self, tmp_path):
+        """Verify raster content in vector output uses the figure dpi."""
+        fig = Figure(figsize=(3, 3), dpi=200)
+        fig.add_subplot().imshow(np.arange(16.0).reshape(4, 4))
+        save_figure(fig, tmp_path, "image", "pdf", tight=False)
+        fig.set_dpi(72)
+        save_figure(fig, tmp_path, "image_low", "pdf", tight=False)
+
+        def image_width(path):
+            return int(re.search(rb"/Width (\d+)", path.read_bytes()).group(1))
+
+        assert image_width(tmp_path / "image.pdf") > image_width(tmp_path / "image_low.pdf")
+
+    def test_recreates_removed_directory(self, tmp_path):
+        """Verify saving again after the output directory was deleted works."""
+        fig = Figure()
+        out = tmp_path / "out"
+        save_figure(fig, out, "first", "png")
+        shutil.rmtree(out)
+        save_figure(fig, out, "second", "png")
+        assert (out / "second.png").exists()
+
+
 # ---------------------------------------------------------------------------
 # wrap_lines
 # ---------------------------------------------------------------------------
@@ -31,6 +104,40 @@ class TestWrapLines:
         assert len(result) >= 2
         assert all(len(line) <= 10 for line in result)
 
+    def test_short_text_matches_textwrap(self):
+        """Verify the short-text fast path agrees with textwrap."""
+        for text in ("short", "  short ", "a\nb", "a  b", "tab\there"):
+            assert wrap_lines(text, width=10) == textwrap.wrap(
+                text, width=10, break_long_words=False, break_on_hyphens=False
+            )
+
+    def test_non_positive_width_keeps_text(self):
+        """Verify a zero width returns the text unwrapped instead of raising."""
+        assert wrap_lines("one two", width=0) == ["one two"]
+
+    def test_hyphenated_words_stay_whole(self):
+        """Verify lines break at whitespace only unless hyphens are allowed."""
+        assert wrap_lines("Lost to follow-up", width=15) == ["Lost to", "follow-up"]
+        assert wrap_lines("Lost to follow-up", width=15, break_on_hyphens=True) == [
+            "Lost to follow-",
+            "up",
+        ]
+
+    def test_cached_result_is_not_shared(self):
+        """Verify mutating a returned list does not leak into later calls."""
+        first = wrap_lines("one two three four", width=10)
+        first.append("extra")
+        assert wrap_lines("one two three four", width=10) == ["one two", "three four"]
+
+    def test_plot_cfd_shares_the_wrap_cache(self):
+        """Verify plot_cfd and wrap_lines hit the same cache entries."""
+        width = load_style_config(style="white")["layout"]["main_title_width"]
+        cfd_util._wrap_cached.cache_clear()
+        plot_cfd([{"heading": "Registered", "N": 1}], ax=Figure().subplots())
+        misses = cfd_util._wrap_cached.cache_info().misses
+        wrap_lines("Registered", width=width)
+        assert cfd_util._wrap_cached.cache_info().misses == misses
+
 
 # ---------------------------------------------------------------------------
 # Colour helpers
@@ -58,6 +165,13 @@ class TestColourHelpers:
         assert _interpolate_color("#000000", "#ffffff", 0.0) == "#000000"
         assert _interpolate_color("#000000", "#ffffff", 1.0) == "#ffffff"
 
+    def test_named_colors_list_is_fresh(self):
+        """Verify the memoised colour-name list is copied for each caller."""
+        names = get_matplotlib_named_colors()
+        assert "steelblue" in names and names == sorted(names)
+        names.clear()
+        assert "steelblue" in get_matplotlib_named_colors()
+
 
 # ---------------------------------------------------------------------------
 # gradient_palette
@@ -88,6 +202,19 @@ class TestGradientPalette:
         assert gradient_palette("#000000", "#ffffff", 0) == []
         assert gradient_palette("#000000", "#ffffff", -1) == []
 
+    def test_rgba_form_matches_hex_form(self):
+        """Verify the RGBA array used for plotting matches the hex palette."""
+        hexes = gradient_palette("#dff1ff", "#dff7e8", 4)
+        rgba = _gradient_rgba("#dff1ff", "#dff7e8", 4)
+        assert rgba.shape == (4, 4)
+        assert [to_hex(row) for row in rgba] == hexes
+
+    def test_cached_result_is_a_fresh_list(self):
+        """Verify mutating a returned palette does not affect later calls."""
+        first = gradient_palette("#000000", "#ffffff", 3)
+        first[0] = "#123456"
+        assert gradient_palette("#000000", "#ffffff", 3)[0] == "#000000"
+
 
 # ---------------------------------------------------------------------------
 # resolve_color
@@ -115,6 +242,18 @@ class TestResolveColor:
         with pytest.raises(ValueError):
             resolve_color("not_a_color_at_all", "#000000")
 
+    def test_hex_is_normalised(self):
+        """Verify uppercase, short and alpha hex forms still normalise."""
+        assert resolve_color("#AABBCC", None) == "#aabbcc"
+        assert resolve_color("#abc", None) == "#aabbcc"
+        assert resolve_color("#aabbcc80", None) == "#aabbcc"
+
+    def test_hex_fast_path_matches_matplotlib(self):
+        """Verify the direct hex normalisation agrees with Matplotlib."""
+        for value in ("#0aF", "#A1b2C3", "#a1b2c3ff", "#ABCDEF00"):
+            assert resolve_color(value, None) == to_hex(value, keep_alpha=False)
+            assert named_color(value) == to_hex(value, keep_alpha=False)
+
 
 # ---------------------------------------------------------------------------
 # _recursive_update
@@ -149,6 +288,21 @@ class TestRecursiveUpdate:
         result = _recursive_update(base, {"b": 2})
         assert result is not base
 
+    def test_deep_nesting_does_not_recurse(self):
+        """Verify configs nested deeper than the recursion limit still merge."""
+        depth = sys.getrecursionlimit() + 50
+
+        def nested(leaf):
+            tree = leaf
+            for _ in range(depth):
+                tree = {"k": tree}
+            return tree
+
+        result = _recursive_update(nested({"a": 1, "b": 2}), nested({"b": 3}))
+        for _ in range(depth):
+            result = result["k"]
+        assert result == {"a": 1, "b": 3}
+
 
 # ---------------------------------------------------------------------------
 # load_style_config
@@ -210,6 +364,47 @@ class TestLoadStyleConfig:
         # Other values should remain at default
         assert cfg["figure"]["figsize_width"] == 12
 
+    def test_cached_config_is_not_shared(self):
+        """Verify mutating a returned config does not leak into later calls."""
+        cfg = load_style_config("white")
+        cfg["figure"]["dpi"] = 1
+        assert load_style_config("white")["figure"]["dpi"] == 200
+
+    def test_edited_custom_config_is_reloaded(self, tmp_path):
+        """Verify editing the custom TOML invalidates the cached config."""
+        toml_file = tmp_path / "override.toml"
+        toml_file.write_text("[figure]\ndpi = 42\n")
+        assert load_style_config("white", str(toml_file))["figure"]["dpi"] == 42
+
+        toml_file.write_text("[figure]\ndpi = 43\n")
+        mtime = toml_file.stat().st_mtime
+        os.utime(toml_file, (mtime + 10, mtime + 10))
+        assert load_style_config("white", str(toml_file))["figure"]["dpi"] == 43
+
+    def test_unreadable_builtin_style_falls_back(self, monkeypatch):
+        """Verify a missing bundled TOML file warns and uses the hard-coded style."""
+        monkeypatch.setitem(cfd_util._BUILTIN_STYLES, "minimal", "missing.toml")
+        with pytest.warns(UserWarning, match="Falling back to hard-coded defaults"):
+            styles = cfd_util._preload_builtin_styles()
+        assert styles["minimal"]["exclusion"]["mode"] == "text"
+        assert styles["minimal"]["figure"] == cfd_util._HARDCODED_FALLBACK["figure"]
+
+    def test_custom_config_removed_after_stat_warns(self, tmp_path, monkeypatch):
+        """Verify a custom file vanishing before it is opened is ignored."""
+        toml_file = tmp_path / "gone.toml"
+        # Simulate the file existing at stat time but not at open time.
+        dir_stat = os.stat(tmp_path)
+        monkeypatch.setattr(cfd_util.os, "stat", lambda path: dir_stat)
+        with pytest.warns(UserWarning, match="does not exist"):
+            cfg = load_style_config("white", str(toml_file))
+        assert cfg["figure"]["dpi"] == 200
+
+    def test_cache_clear(self):
+        """Verify load_style_config.cache_clear empties the config cache."""
+        load_style_config("white")
+        load_style_config.cache_clear()
+        assert _load_style_config_cached.cache_info().currsize == 0
+
     def test_missing_custom_config_warns(self):
         """Verify a missing custom config path emits a warning."""
         with pytest.warns(UserWarning, match="does not exist"):
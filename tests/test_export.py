@@ -279,6 +279,13 @@ class TestPlotAndExport:
                     **{bad_kwarg: "should-be-rejected"},
                 )
 
+    def test_artist_handle_kwargs_raise_type_error(self, sample_data, tmp_path):
+        """Passing `return_artists` / `reuse` raises before anything is written."""
+        for bad_kwarg, value in (("return_artists", True), ("reuse", object())):
+            with pytest.raises(TypeError, match="call plot_cfd directly"):
+                plot_and_export(sample_data, out_dir=tmp_path, name="study", **{bad_kwarg: value})
+        assert list(tmp_path.iterdir()) == []
+
     def test_partial_args_raises_value_error(self, sample_data, tmp_path):
         """Providing exactly one of (out_dir, name) is an error.
 
@@ -0,0 +1,55 @@
+"""Tests for pycohortflow._fast with the Numba-compiled kernels.
+
+Skipped unless the ``fast`` extra is installed; without Numba the
+kernels run as plain Python and are covered through ``plot_cfd``.
+"""
+
+import numpy as np
+import pytest
+from matplotlib.patches import BoxStyle, FancyBboxPatch
+
+numba = pytest.importorskip("numba")
+
+from pycohortflow import _fast  # noqa: E402
+from pycohortflow._fast import box_paths  # noqa: E402
+
+
+@pytest.fixture
+def corners():
+    """Corner coordinates ``(x0, y0, x1, y1)`` of a few boxes."""
+    rng = np.random.default_rng(0)
+    x0 = rng.uniform(-2, 2, 7)
+    y0 = rng.uniform(0, 10, 7)
+    return x0, y0, x0 + rng.uniform(0.5, 3, 7), y0 + rng.uniform(0.3, 1, 7)
+
+
+@pytest.mark.parametrize("name", ["_rect_vertices", "_round_rect_vertices"])
+def test_kernels_are_compiled(name):
+    """With Numba installed the kernels are jitted, not the fallback."""
+    assert isinstance(getattr(_fast, name), numba.core.registry.CPUDispatcher)
+
+
+def test_compiled_kernels_match_python(corners):
+    """Compiled and pure-Python kernels produce identical vertices."""
+    np.testing.assert_array_equal(
+        _fast._rect_vertices(*corners), _fast._rect_vertices.py_func(*corners)
+    )
+    np.testing.assert_array_equal(
+        _fast._round_rect_vertices(*corners, 0.05),
+        _fast._round_rect_vertices.py_func(*corners, 0.05),
+    )
+
+
+@pytest.mark.parametrize("radius", [0.0, 0.05, 0.2])
+def test_box_paths_match_fancybboxpatch(corners, radius):
+    """Compiled ``box_paths`` equals the FancyBboxPatch outlines it replaces."""
+    x0, y0, x1, y1 = corners
+    pad = 0.03
+    paths = box_paths(x0, y0, x1 - x0, y1 - y0, pad, radius)
+    style = (
+        BoxStyle("Round", pad=pad, rounding_size=radius) if radius else BoxStyle("Square", pad=pad)
+    )
+    for path, x, y, w, h in zip(paths, x0, y0, x1 - x0, y1 - y0):
+        ref = FancyBboxPatch((x, y), w, h, boxstyle=style).get_path()
+        np.testing.assert_allclose(path.vertices, ref.vertices)
+        np.testing.assert_array_equal(path.codes, ref.codes)